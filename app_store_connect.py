@@ -30,6 +30,10 @@ Translation:
     python app_store_connect.py --translate
     python app_store_connect.py --translate --force
     python app_store_connect.py --translate --only de
+    python app_store_connect.py --translate --concurrency 4
+    python app_store_connect.py --translate --batch
+    python app_store_connect.py --translate --bundle
+    python app_store_connect.py --translate --no-cache
 
 Upload:
     python app_store_connect.py --send --ios-version 1.0.0
@@ -53,44 +57,170 @@ Optional:
 
 REQUIREMENTS
 ------------
-    pip install requests PyJWT cryptography python-dotenv anthropic
+    pip install requests "httpx[http2,brotli]" PyJWT cryptography python-dotenv anthropic
+
+    Optional: pip install orjson (faster JSON parsing and writing)
+    Optional: pip install uvloop (faster event loop for --translate, not on Windows)
 """
 import jwt
 import time
+import threading
 import requests
+from requests.adapters import HTTPAdapter
+import httpx
+import asyncio
+import functools
+import hashlib
+import importlib.util
 import json
 import os
 import re
+import sqlite3
 import argparse
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 from . import config
 
+# Section separator for console output
+BAR = "=" * 50
+
+# Translation cache kept in the project directory (disable with --no-cache)
+TRANSLATION_CACHE_FILE = ".translation_cache.sqlite"
+
+# Maximum number of Claude requests in flight at once during --translate
+DEFAULT_CONCURRENCY = 8
+
+# Seconds to wait for a single Claude response
+CLAUDE_TIMEOUT = 120
+
+# Only advertise Brotli when a decoder is installed (pip install "httpx[brotli]")
+HAS_BROTLI = any(importlib.util.find_spec(name) for name in ("brotli", "brotlicffi"))
+ACCEPT_ENCODING = "br, gzip" if HAS_BROTLI else "gzip"
+
+# Seconds to wait for a single App Store Connect response
+ASC_TIMEOUT = 60
+
+# Stop streaming an attempt once its translation passes this multiple of the char limit
+STREAM_ABORT_SLACK = 1.1
+
+# Stands in for {target_language} in the system prompt so it is identical for every locale
+SHARED_TARGET_LANGUAGE = "text in the target language named in each request"
+
+# Prompt caching is generally available; the beta header is kept for older API versions
+PROMPT_CACHING_BETA = "prompt-caching-2024-07-31"
+
+# Source files, in the order they are translated and reported
+SOURCE_FILES = ["new.txt", "desc.txt", "promo.txt", "keywords.txt"]
+
+# Source file to the upload field it fills
+FILE_TO_FIELD = {
+    "new.txt": "whats_new",
+    "desc.txt": "description",
+    "promo.txt": "promotional_text",
+    "keywords.txt": "keywords"
+}
+
+# Description of each source file, used in translation prompts
+TEXT_TYPES = {
+    "new.txt": "What's New / Release Notes",
+    "desc.txt": "App Description",
+    "promo.txt": "Promotional Text",
+    "keywords.txt": "App Store Keywords (comma-separated search terms)"
+}
+
+# Delimited blocks in a translation response (see config.DEFAULT_SYSTEM_PROMPT)
+TRANSLATION_RE = re.compile(r'===TRANSLATION_START===\s*([\s\S]*?)\s*===TRANSLATION_END===')
+CONSIDERATIONS_RE = re.compile(r'===CONSIDERATIONS_START===\s*([\s\S]*?)\s*===CONSIDERATIONS_END===')
+
+# Per-field blocks in a bundled (--bundle) response, e.g. ===TRANSLATION:promo=== ... ===END:promo===
+BUNDLE_TRANSLATION_RE = re.compile(r"===TRANSLATION:(\w+)===\s*(.*?)\s*===END:\1===", re.S)
+
+# Claude only caches prompt prefixes of at least 1024 tokens; at roughly four
+# characters per token, shorter prefixes aren't worth warming up first
+PROMPT_CACHE_MIN_CHARS = 4096
+
+# Message Batches (--batch)
+MESSAGE_BATCHES_BETA = "message-batches-2024-09-24"
+BATCH_POLL_INTERVAL = 30
+# Consecutive failed status checks tolerated while waiting for a batch
+BATCH_POLL_RETRIES = 5
+
+
+def _json_loads(data):
+    """Parse JSON from bytes or str, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _json_dumps(obj) -> bytes:
+    """Serialize obj to indented UTF-8 JSON bytes, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+    return json.dumps(obj, ensure_ascii=False, indent=2).encode("utf-8")
+
 
 def get_script_dir():
     """Get the directory containing the script or current working directory."""
     return Path.cwd()
 
 
+def find_locale_folders(base_dir: Path) -> list:
+    """
+    Find the target locale folders (every known locale except en) in base_dir.
+
+    Returns a list of (folder_path, locale_code) tuples sorted by folder name.
+    """
+    # scandir's DirEntry.is_dir() uses the directory entry type, so this needs
+    # no extra stat per entry (symlinked folders are still followed)
+    with os.scandir(base_dir) as entries:
+        return sorted(
+            (Path(entry.path), config.FOLDER_TO_LOCALE[entry.name]) for entry in entries
+            if entry.name in config.FOLDER_NAMES and entry.is_dir()
+        )
+
+
+def read_locale_files(folder: Path) -> dict:
+    """
+    Read whichever SOURCE_FILES exist in folder, using a single directory scan.
+
+    Returns {filename: stripped text}; empty if the folder doesn't exist.
+    """
+    found = {}
+    try:
+        with os.scandir(folder) as entries:
+            for entry in entries:
+                if entry.name in FILE_TO_FIELD and entry.is_file():
+                    found[entry.name] = Path(entry.path).read_text(encoding="utf-8").strip()
+    except (FileNotFoundError, NotADirectoryError):
+        pass
+    return found
+
+
 def load_english_source(base_dir: Path = None):
     """Load the English source text files."""
     base_dir = base_dir or get_script_dir()
     en_dir = base_dir / "en"
+    found = read_locale_files(en_dir)
 
     sources = {}
-    for filename in ["new.txt", "desc.txt", "promo.txt", "keywords.txt"]:
-        filepath = en_dir / filename
-        if filepath.exists():
-            sources[filename] = filepath.read_text(encoding="utf-8").strip()
+    for filename in SOURCE_FILES:
+        if filename in found:
+            sources[filename] = found[filename]
         else:
-            print(f"Warning: {filepath} not found")
+            print(f"Warning: {en_dir / filename} not found")
 
     return sources
 
 
-def translate_with_claude(text: str, target_language: str, text_type: str,
-                          char_limit: int = None, max_retries: int = 2) -> dict:
-    """Send text to Claude for translation and get structured response with retry logic."""
+def _claude_headers(*betas) -> dict:
+    """Build Claude API request headers, optionally opting into beta features."""
     api_key = config.CLAUDE_API_KEY or os.environ.get("CLAUDE_API_KEY")
     if not api_key:
         raise ValueError("CLAUDE_API_KEY environment variable not set")
@@ -100,95 +230,701 @@ def translate_with_claude(text: str, target_language: str, text_type: str,
         "x-api-key": api_key,
         "anthropic-version": "2023-06-01"
     }
+    if betas:
+        headers["anthropic-beta"] = ",".join(betas)
+    return headers
+
+
+@functools.lru_cache(maxsize=8)
+def _format_system_prompt(template: str, app_name: str, app_description: str, brand_voice: str) -> str:
+    """Fill in the system prompt template once per distinct app configuration."""
+    return template.format(
+        app_name=app_name,
+        app_description=app_description,
+        brand_voice=brand_voice,
+        target_language=SHARED_TARGET_LANGUAGE
+    )
+
 
-    system_prompt = config.DEFAULT_SYSTEM_PROMPT.format(
-        app_name=config.APP_NAME,
-        app_description=config.APP_DESCRIPTION,
-        brand_voice=config.BRAND_VOICE,
-        target_language=target_language
+def _system_blocks() -> list:
+    """
+    Build the translator system prompt as a cacheable content block.
+
+    The target language is named in each user message instead, so every
+    locale shares the same cached system prompt.
+    """
+    # Keyed on the current config values, so programmatic overrides still apply
+    system_prompt = _format_system_prompt(
+        config.DEFAULT_SYSTEM_PROMPT, config.APP_NAME, config.APP_DESCRIPTION, config.BRAND_VOICE
     )
+    return [{"type": "text", "text": system_prompt, "cache_control": {"type": "ephemeral"}}]
+
 
+def _prefix_is_cacheable(source_text: str) -> bool:
+    """Estimate whether the system prompt plus source text is long enough for Claude to cache."""
+    return len(_system_blocks()[0]["text"]) + len(source_text) >= PROMPT_CACHE_MIN_CHARS
+
+
+def build_translation_payload(text: str, target_language: str, text_type: str,
+                              char_limit: int = None) -> dict:
+    """Build the Messages API payload for the first translation attempt of a text."""
     limit_instruction = ""
     if char_limit:
         limit_instruction = f"\n\nCRITICAL: The translation MUST be {char_limit} characters or less. This is a hard App Store limit. Be concise."
 
-    base_user_prompt = f"""Please translate the following {text_type} text to {target_language}.{limit_instruction}
+    # The system prompt and source text come first and are marked as
+    # prompt-cache breakpoints, so every locale of the same file (and every
+    # char-limit retry) reads them from cache. Only the instruction after them
+    # is locale-specific.
+    user_content = [
+        {
+            "type": "text",
+            "text": f"SOURCE TEXT:\n{text}",
+            "cache_control": {"type": "ephemeral"}
+        },
+        {
+            "type": "text",
+            "text": f"Please translate the {text_type} source text above to {target_language}.{limit_instruction}"
+        },
+        {
+            "type": "text",
+            "text": "Remember: Use the exact delimiter format specified (===TRANSLATION_START===, etc.)."
+        }
+    ]
 
-SOURCE TEXT:
-{text}
+    return {
+        "model": config.CLAUDE_MODEL,
+        "max_tokens": 4096,
+        "system": _system_blocks(),
+        "messages": [{"role": "user", "content": user_content}]
+    }
 
-Remember: Use the exact delimiter format specified (===TRANSLATION_START===, etc.)."""
 
-    messages = [{"role": "user", "content": base_user_prompt}]
-    last_error = None
+def parse_translation_response(content: str) -> dict:
+    """Extract the translation and considerations from a delimited Claude response."""
+    translation_match = TRANSLATION_RE.search(content)
+    considerations_match = CONSIDERATIONS_RE.search(content)
 
-    for attempt in range(max_retries + 1):
-        payload = {
-            "model": config.CLAUDE_MODEL,
-            "max_tokens": 4096,
-            "system": system_prompt,
-            "messages": messages
-        }
+    if not translation_match:
+        raise ValueError(f"Could not find translation in response:\n{content[:500]}")
 
-        response = requests.post(config.CLAUDE_API_URL, headers=headers, json=payload)
-        response.raise_for_status()
+    return {
+        "translation": translation_match.group(1).strip(),
+        "considerations": considerations_match.group(1).strip() if considerations_match else "No considerations provided"
+    }
 
-        result = response.json()
-        content = result["content"][0]["text"]
 
-        translation_match = re.search(
-            r'===TRANSLATION_START===\s*([\s\S]*?)\s*===TRANSLATION_END===',
-            content
-        )
-        considerations_match = re.search(
-            r'===CONSIDERATIONS_START===\s*([\s\S]*?)\s*===CONSIDERATIONS_END===',
-            content
-        )
+async def _stream_translation(client: httpx.AsyncClient, headers: dict, payload: dict,
+                              char_limit: int = None) -> tuple:
+    """
+    Stream a translation response from Claude.
+
+    Returns (content, overflow). If the text after ===TRANSLATION_START===
+    grows past char_limit * STREAM_ABORT_SLACK before ===TRANSLATION_END===
+    arrives, the stream is closed early and overflow is the length reached;
+    otherwise overflow is None and content is the full response text.
+    """
+    abort_at = int(char_limit * STREAM_ABORT_SLACK) if char_limit else None
+    start_marker = "===TRANSLATION_START==="
+    end_marker = "===TRANSLATION_END==="
+    content = ""
+    translation_start = -1
+
+    async with client.stream("POST", config.CLAUDE_API_URL, headers=headers, json=payload,
+                             timeout=httpx.Timeout(CLAUDE_TIMEOUT)) as response:
+        if response.status_code >= 400:
+            await response.aread()
+            response.raise_for_status()
+
+        async for line in response.aiter_lines():
+            if not line.startswith("data:"):
+                continue
 
-        if not translation_match:
-            raise ValueError(f"Could not find translation in response:\n{content[:500]}")
+            event = _json_loads(line[5:])
+            if event["type"] == "error":
+                raise ValueError(f"Claude stream error: {event['error'].get('message', event['error'])}")
+            if event["type"] != "content_block_delta" or event["delta"].get("type") != "text_delta":
+                continue
 
-        translation = translation_match.group(1).strip()
-        considerations = considerations_match.group(1).strip() if considerations_match else "No considerations provided"
+            content += event["delta"]["text"]
 
-        if char_limit and len(translation) > char_limit:
-            last_error = f"Translation is {len(translation)} chars, limit is {char_limit}"
+            if abort_at is None:
+                continue
+            if translation_start < 0:
+                marker_index = content.find(start_marker)
+                if marker_index < 0:
+                    continue
+                translation_start = marker_index + len(start_marker)
+            if end_marker in content:
+                # The final length is measured by the parser
+                abort_at = None
+                continue
+
+            # Only count the translation itself: not the whitespace around it,
+            # nor the start of an end marker split across deltas
+            translated = content[translation_start:].lstrip()
+            marker_index = translated.find("===")
+            if marker_index >= 0:
+                translated = translated[:marker_index]
+            else:
+                for size in range(min(len(translated), 2), 0, -1):
+                    if translated.endswith(end_marker[:size]):
+                        translated = translated[:-size]
+                        break
+            translated_so_far = len(translated.rstrip())
+            if translated_so_far > abort_at:
+                return content, translated_so_far
+
+    return content, None
+
+
+async def translate_with_claude(client: httpx.AsyncClient, text: str, target_language: str,
+                                text_type: str, char_limit: int = None, max_retries: int = 2) -> dict:
+    """
+    Send text to Claude for translation and get structured response with retry logic.
+
+    The response is streamed, so an attempt that is clearly running over
+    char_limit is cut off and retried without waiting for it to finish.
+    """
+    headers = _claude_headers(PROMPT_CACHING_BETA)
+    payload = build_translation_payload(text, target_language, text_type, char_limit)
+    payload["stream"] = True
+    messages = payload["messages"]
+    last_error = None
+
+    for attempt in range(max_retries + 1):
+        content, overflow = await _stream_translation(client, headers, payload, char_limit)
+
+        if overflow:
+            length = f"over {overflow}"
+        else:
+            parsed = parse_translation_response(content)
+            length = str(len(parsed["translation"]))
+
+        if char_limit and (overflow or len(parsed["translation"]) > char_limit):
+            last_error = f"Translation is {length} chars, limit is {char_limit}"
             if attempt < max_retries:
-                print(f"      Retry {attempt + 1}: {last_error}")
-                messages.append({"role": "assistant", "content": content})
+                print(f"      Retry {attempt + 1} ({target_language}, {text_type}): {last_error}")
+                messages.append({"role": "assistant", "content": content.rstrip()})
                 messages.append({
                     "role": "user",
-                    "content": f"ERROR: Your translation is {len(translation)} characters but the MAXIMUM allowed is {char_limit} characters. This is a hard App Store Connect limit. Please shorten the translation significantly while preserving the key message. You MUST stay under {char_limit} characters."
+                    "content": f"ERROR: Your translation is {length} characters but the MAXIMUM allowed is {char_limit} characters. This is a hard App Store Connect limit. Please shorten the translation significantly while preserving the key message. You MUST stay under {char_limit} characters."
                 })
                 continue
             else:
                 raise ValueError(f"Failed after {max_retries} retries: {last_error}")
 
-        return {
-            "translation": translation,
-            "considerations": considerations
-        }
+        return parsed
 
     raise ValueError(f"Translation failed: {last_error}")
 
 
+# =============================================================================
+# Bundled Translation (all fields of a locale in one request)
+# =============================================================================
+
+def build_bundle_prompt(sources: dict, target_language: str) -> str:
+    """Build a single user prompt asking for every source file in sources at once."""
+    sections = []
+    for filename, text in sources.items():
+        field = Path(filename).stem
+        text_type = TEXT_TYPES.get(filename, "App Store text")
+        char_limit = config.CHAR_LIMITS.get(filename)
+        limit_note = f", MAXIMUM {char_limit} characters" if char_limit else ""
+        sections.append(f"===FIELD:{field}=== ({text_type}{limit_note})\n{text}")
+
+    format_example = "\n\n".join(
+        f"===TRANSLATION:{field}===\n(translated {field} text)\n===END:{field}==="
+        for field in (Path(filename).stem for filename in sources)
+    )
+    fields_text = "\n\n".join(sections)
+
+    return f"""Please translate each of the following App Store fields to {target_language}.
+Character limits are hard App Store Connect limits. Be concise where needed.
+
+{fields_text}
+
+For this request, do NOT use a single ===TRANSLATION_START=== block. Instead, respond with one block per field, in this exact format:
+
+{format_example}
+
+===CONSIDERATIONS_START===
+(Brief notes covering all fields)
+===CONSIDERATIONS_END==="""
+
+
+def parse_bundle_response(content: str, fields: list) -> dict:
+    """Extract {field: translation} from a bundled response. Raises ValueError if a field is missing."""
+    translations = {m.group(1): m.group(2).strip() for m in BUNDLE_TRANSLATION_RE.finditer(content)}
+
+    missing = [field for field in fields if field not in translations]
+    if missing:
+        raise ValueError(f"Bundled response is missing fields {missing}:\n{content[:500]}")
+
+    return translations
+
+
+async def translate_bundle_with_claude(client: httpx.AsyncClient, sources: dict, target_language: str,
+                                       max_retries: int = 2) -> dict:
+    """
+    Translate several source files to one language in a single Claude request.
+
+    sources maps filename to English text. Fields that exceed their character
+    limit are re-requested on their own, up to max_retries times. Returns
+    {filename: result dict}, where a field that never fits its limit maps to
+    a ValueError instead. Raises ValueError if the response can't be parsed.
+    """
+    headers = _claude_headers(PROMPT_CACHING_BETA)
+    messages = [{"role": "user", "content": build_bundle_prompt(sources, target_language)}]
+    payload = {
+        "model": config.CLAUDE_MODEL,
+        "max_tokens": 8192,
+        "system": _system_blocks(),
+        "messages": messages
+    }
+
+    filenames = {Path(filename).stem: filename for filename in sources}
+    pending = list(filenames)
+    translations = {}
+    considerations = "No considerations provided"
+
+    for attempt in range(max_retries + 1):
+        response = await client.post(config.CLAUDE_API_URL, headers=headers, json=payload,
+                                     timeout=httpx.Timeout(CLAUDE_TIMEOUT))
+        response.raise_for_status()
+
+        content = _json_loads(response.content)["content"][0]["text"]
+        parsed = parse_bundle_response(content, pending)
+        translations.update({field: parsed[field] for field in pending})
+
+        considerations_match = CONSIDERATIONS_RE.search(content)
+        if considerations_match:
+            considerations = considerations_match.group(1).strip()
+
+        over_limit = {}
+        for field in pending:
+            char_limit = config.CHAR_LIMITS.get(filenames[field])
+            if char_limit and len(translations[field]) > char_limit:
+                over_limit[field] = (len(translations[field]), char_limit)
+
+        if not over_limit or attempt == max_retries:
+            break
+
+        print(f"      Retry {attempt + 1} ({target_language}, bundled): "
+              + ", ".join(f"{field} is {length}/{limit} chars" for field, (length, limit) in over_limit.items()))
+        pending = list(over_limit)
+        messages.append({"role": "assistant", "content": content})
+        messages.append({
+            "role": "user",
+            "content": "ERROR: These translations exceed their hard App Store Connect limits: "
+                       + ", ".join(f"{field} is {length} characters but the MAXIMUM is {limit}"
+                                   for field, (length, limit) in over_limit.items())
+                       + ". Please shorten them significantly while preserving the key message. "
+                       "Respond with ONLY these fields, using the same ===TRANSLATION:field=== / ===END:field=== format."
+        })
+
+    results = {}
+    for field, filename in filenames.items():
+        char_limit = config.CHAR_LIMITS.get(filename)
+        translation = translations[field]
+        if char_limit and len(translation) > char_limit:
+            results[filename] = ValueError(
+                f"Failed after {max_retries} retries: Translation is {len(translation)} chars, limit is {char_limit}"
+            )
+        else:
+            results[filename] = {"translation": translation, "considerations": considerations}
+
+    return results
+
+
+# =============================================================================
+# Claude Message Batches
+# =============================================================================
+
+async def submit_claude_batch(client: httpx.AsyncClient, requests_list: list) -> dict:
+    """
+    Submit a Message Batch to Claude.
+
+    Each item in requests_list is {"custom_id": ..., "params": <Messages API payload>}.
+    Returns the batch object, including its id.
+    """
+    response = await client.post(
+        config.CLAUDE_BATCH_API_URL,
+        headers=_claude_headers(MESSAGE_BATCHES_BETA),
+        json={"requests": requests_list},
+        timeout=httpx.Timeout(CLAUDE_TIMEOUT)
+    )
+    response.raise_for_status()
+    return _json_loads(response.content)
+
+
+def _is_transient_http_error(error: Exception) -> bool:
+    """Return True for network errors and 429/5xx responses, which are worth retrying."""
+    if isinstance(error, httpx.TransportError):
+        return True
+    if isinstance(error, httpx.HTTPStatusError):
+        status = error.response.status_code
+        return status == 429 or status >= 500
+    return False
+
+
+async def wait_for_claude_batch(client: httpx.AsyncClient, batch_id: str,
+                                poll_interval: int = BATCH_POLL_INTERVAL) -> dict:
+    """
+    Poll a Message Batch until processing has ended and return the final batch object.
+
+    Network errors and 429/5xx responses are retried on the next poll; up to
+    BATCH_POLL_RETRIES in a row are tolerated before the error is raised.
+    """
+    url = f"{config.CLAUDE_BATCH_API_URL}/{batch_id}"
+    headers = _claude_headers(MESSAGE_BATCHES_BETA)
+    failures = 0
+
+    while True:
+        try:
+            response = await client.get(url, headers=headers, timeout=httpx.Timeout(CLAUDE_TIMEOUT))
+            response.raise_for_status()
+        except Exception as e:
+            failures += 1
+            if failures > BATCH_POLL_RETRIES or not _is_transient_http_error(e):
+                raise
+            reason = (f"HTTP {e.response.status_code}" if isinstance(e, httpx.HTTPStatusError)
+                      else type(e).__name__)
+            print(f"    Batch {batch_id}: status check failed ({reason}), retrying "
+                  f"({failures}/{BATCH_POLL_RETRIES})...")
+            await asyncio.sleep(poll_interval)
+            continue
+
+        failures = 0
+        batch = _json_loads(response.content)
+
+        if batch["processing_status"] == "ended":
+            return batch
+
+        counts = batch.get("request_counts", {})
+        print(f"    Batch {batch_id}: {counts.get('processing', '?')} request(s) still processing...")
+        await asyncio.sleep(poll_interval)
+
+
+async def get_claude_batch_results(client: httpx.AsyncClient, results_url: str) -> dict:
+    """Stream a finished batch's JSONL results. Returns {custom_id: result}."""
+    results = {}
+    headers = _claude_headers(MESSAGE_BATCHES_BETA)
+
+    async with client.stream("GET", results_url, headers=headers,
+                             timeout=httpx.Timeout(CLAUDE_TIMEOUT)) as response:
+        response.raise_for_status()
+        async for line in response.aiter_lines():
+            if line.strip():
+                item = _json_loads(line)
+                results[item["custom_id"]] = item["result"]
+
+    return results
+
+
 def check_file_needs_translation(filepath: Path, char_limit: int = None) -> tuple:
-    """Check if a file needs translation. Returns (needs_translation, reason)."""
+    """
+    Check if a file needs translation.
+
+    Returns (needs_translation, reason, content), where content is the
+    stripped file text, or None if the file doesn't exist.
+    """
     if not filepath.exists():
-        return True, "file missing"
+        return True, "file missing", None
 
     content = filepath.read_text(encoding="utf-8").strip()
     if not content:
-        return True, "file empty"
+        return True, "file empty", content
 
     if char_limit and len(content) > char_limit:
-        return True, f"over limit ({len(content)}/{char_limit} chars)"
+        return True, f"over limit ({len(content)}/{char_limit} chars)", content
+
+    return False, f"OK ({len(content)} chars)", content
+
 
-    return False, f"OK ({len(content)} chars)"
+# =============================================================================
+# Translation Cache
+# =============================================================================
+
+def open_translation_cache(base_dir: Path) -> sqlite3.Connection:
+    """Open (creating if needed) the translation cache in base_dir."""
+    conn = sqlite3.connect(base_dir / TRANSLATION_CACHE_FILE)
+    conn.execute(
+        """CREATE TABLE IF NOT EXISTS translations (
+            hash TEXT,
+            lang TEXT,
+            model TEXT,
+            translation TEXT,
+            considerations TEXT,
+            PRIMARY KEY (hash, lang, model)
+        )"""
+    )
+    return conn
 
 
-def translate_all(base_dir: Path = None, force: bool = False, only: str = None):
-    """Translate all English source files to all target languages."""
+def _source_hash(text: str, text_type: str) -> str:
+    """Hash the source text together with everything else in the prompt that shapes its translation."""
+    key = hashlib.sha256()
+    for part in (text, text_type, _system_blocks()[0]["text"]):
+        key.update(part.encode("utf-8") + b"\0")
+    return key.hexdigest()
+
+
+def get_cached_translation(conn: sqlite3.Connection, source_text: str, target_language: str,
+                           text_type: str) -> dict:
+    """
+    Look up an earlier translation of source_text for the current prompt and model.
+
+    Returns a result dict like translate_with_claude(), or None on a miss.
+    """
+    row = conn.execute(
+        "SELECT translation, considerations FROM translations WHERE hash = ? AND lang = ? AND model = ?",
+        (_source_hash(source_text, text_type), target_language, config.CLAUDE_MODEL)
+    ).fetchone()
+    if row is None:
+        return None
+    return {"translation": row[0], "considerations": row[1]}
+
+
+def store_cached_translation(conn: sqlite3.Connection, source_text: str, target_language: str,
+                             text_type: str, result: dict):
+    """Remember a successful translation of source_text for the current prompt and model."""
+    conn.execute(
+        "INSERT OR REPLACE INTO translations VALUES (?, ?, ?, ?, ?)",
+        (_source_hash(source_text, text_type), target_language, config.CLAUDE_MODEL,
+         result["translation"], result["considerations"])
+    )
+
+
+def _claude_client(concurrency: int = DEFAULT_CONCURRENCY) -> httpx.AsyncClient:
+    """Create the pooled HTTP/2 client shared by all Claude requests in a run."""
+    return httpx.AsyncClient(
+        http2=config.HAS_HTTP2,
+        limits=httpx.Limits(max_connections=concurrency),
+        headers={"Accept-Encoding": ACCEPT_ENCODING}
+    )
+
+
+async def _save_translation(job: dict, result: dict):
+    """Write a finished translation to its output file without blocking the event loop."""
+    await asyncio.to_thread(job["output_path"].write_text, result["translation"], encoding="utf-8")
+
+
+async def _run_translation_jobs(jobs: list, concurrency: int = DEFAULT_CONCURRENCY) -> list:
+    """
+    Translate every job concurrently over a shared HTTP client.
+
+    For each source file whose prompt prefix is long enough to be cached, the
+    first locale is translated on its own to write the prefix to Claude's
+    cache; its other locales then run concurrently and read it back. Shorter
+    files run all their locales concurrently straight away. Each translation is written to its output
+    file as soon as it finishes. Returns one entry per job, in order: the
+    translate_with_claude() result dict, or the exception raised for that job.
+    """
+    semaphore = asyncio.Semaphore(concurrency)
+    outcomes = [None] * len(jobs)
+
+    by_file = {}
+    for index, job in enumerate(jobs):
+        by_file.setdefault(job["filename"], []).append(index)
+
+    async with _claude_client(concurrency) as client:
+        async def run(index):
+            job = jobs[index]
+            try:
+                async with semaphore:
+                    result = await translate_with_claude(
+                        client,
+                        job["source_text"],
+                        job["locale_name"],
+                        job["text_type"],
+                        char_limit=job["char_limit"],
+                        max_retries=2
+                    )
+                await _save_translation(job, result)
+                outcomes[index] = result
+            except Exception as e:
+                outcomes[index] = e
+
+        async def run_file(indexes):
+            if len(indexes) > 1 and _prefix_is_cacheable(jobs[indexes[0]]["source_text"]):
+                await run(indexes[0])
+                indexes = indexes[1:]
+            await asyncio.gather(*(run(index) for index in indexes))
+
+        await asyncio.gather(*(run_file(indexes) for indexes in by_file.values()))
+
+    return outcomes
+
+
+async def _run_translation_batch(jobs: list, concurrency: int = DEFAULT_CONCURRENCY) -> list:
+    """
+    Translate every job through one Claude Message Batch.
+
+    Translations that come back over their character limit are retried
+    directly with translate_with_claude(). Results are written to their
+    output files as they become available. Returns one entry per job, in the
+    same form as _run_translation_jobs().
+
+    If the batch can't be submitted, polled or read, every job gets the same
+    error, naming the batch id if it was submitted.
+    """
+    requests_list = [
+        {
+            # custom_id only allows letters, digits, "-" and "_"
+            "custom_id": f"{job['folder_name']}-{Path(job['filename']).stem}",
+            "params": build_translation_payload(
+                job["source_text"], job["locale_name"], job["text_type"], job["char_limit"]
+            )
+        }
+        for job in jobs
+    ]
+
+    batch_id = None
+    try:
+        async with _claude_client() as client:
+            batch = await submit_claude_batch(client, requests_list)
+            batch_id = batch["id"]
+            print(f"  Submitted batch {batch_id} ({len(requests_list)} requests)")
+            batch = await wait_for_claude_batch(client, batch_id)
+            batch_results = await get_claude_batch_results(client, batch["results_url"])
+    except Exception as e:
+        if batch_id:
+            error = ValueError(f"Batch {batch_id} failed: {e} (results stay available in "
+                               f"the Anthropic Console for 29 days)")
+        else:
+            error = ValueError(f"Batch submission failed: {e}")
+        return [error] * len(jobs)
+
+    outcomes = []
+    ready = []
+    over_limit = []
+
+    for index, (job, request) in enumerate(zip(jobs, requests_list)):
+        result = batch_results.get(request["custom_id"])
+        if not result or result["type"] != "succeeded":
+            status = result["type"] if result else "missing"
+            error = (result or {}).get("error")
+            if isinstance(error, dict):
+                # Errored results wrap the API error, e.g. {"type": "error", "error": {...}}
+                error = error.get("error", error)
+                error = error.get("message", error) if isinstance(error, dict) else error
+            outcomes.append(ValueError(f"Batch request {status}" + (f": {error}" if error else "")))
+            continue
+
+        try:
+            parsed = parse_translation_response(result["message"]["content"][0]["text"])
+        except ValueError as e:
+            outcomes.append(e)
+            continue
+
+        char_limit = job["char_limit"]
+        if char_limit and len(parsed["translation"]) > char_limit:
+            print(f"    {job['folder_name']}/{job['filename']}: {len(parsed['translation'])} chars, "
+                  f"limit is {char_limit}; retrying directly")
+            over_limit.append(index)
+            outcomes.append(None)
+        else:
+            ready.append(index)
+            outcomes.append(parsed)
+
+    await asyncio.gather(*(_save_translation(jobs[i], outcomes[i]) for i in ready))
+
+    if over_limit:
+        retried = await _run_translation_jobs([jobs[i] for i in over_limit], concurrency)
+        for index, outcome in zip(over_limit, retried):
+            outcomes[index] = outcome
+
+    return outcomes
+
+
+async def _run_translation_bundles(jobs: list, concurrency: int = DEFAULT_CONCURRENCY) -> list:
+    """
+    Translate jobs with one bundled request per locale.
+
+    Locales whose bundled response can't be parsed fall back to one request
+    per file. Results are written to their output files as each locale
+    finishes. Returns one entry per job, in the same form as
+    _run_translation_jobs().
+    """
+    by_locale = {}
+    for index, job in enumerate(jobs):
+        by_locale.setdefault(job["folder_name"], []).append(index)
+
+    semaphore = asyncio.Semaphore(concurrency)
+    outcomes = [None] * len(jobs)
+
+    async with _claude_client(concurrency) as client:
+        async def translate_one(job):
+            async with semaphore:
+                result = await translate_with_claude(
+                    client,
+                    job["source_text"],
+                    job["locale_name"],
+                    job["text_type"],
+                    char_limit=job["char_limit"],
+                    max_retries=2
+                )
+            await _save_translation(job, result)
+            return result
+
+        async def run(indexes):
+            locale_jobs = [jobs[i] for i in indexes]
+            if len(locale_jobs) > 1:
+                try:
+                    async with semaphore:
+                        bundle = await translate_bundle_with_claude(
+                            client,
+                            {job["filename"]: job["source_text"] for job in locale_jobs},
+                            locale_jobs[0]["locale_name"]
+                        )
+                    for i, job in zip(indexes, locale_jobs):
+                        outcomes[i] = bundle[job["filename"]]
+                    await asyncio.gather(*(
+                        _save_translation(job, bundle[job["filename"]]) for job in locale_jobs
+                        if not isinstance(bundle[job["filename"]], Exception)
+                    ))
+                    return
+                except ValueError as e:
+                    print(f"    {locale_jobs[0]['folder_name']}: bundled translation failed, "
+                          f"falling back to one request per file ({str(e)[:80]})")
+
+            results = await asyncio.gather(*(translate_one(job) for job in locale_jobs),
+                                           return_exceptions=True)
+            for i, result in zip(indexes, results):
+                outcomes[i] = result
+
+        results = await asyncio.gather(*(run(indexes) for indexes in by_locale.values()),
+                                       return_exceptions=True)
+
+    # A locale-level error (e.g. HTTP failure) applies to each of its files
+    for indexes, result in zip(by_locale.values(), results):
+        if isinstance(result, Exception):
+            for i in indexes:
+                outcomes[i] = result
+
+    return outcomes
+
+
+def translate_all(base_dir: Path = None, force: bool = False, only: str = None,
+                  concurrency: int = DEFAULT_CONCURRENCY, batch: bool = False,
+                  bundle: bool = False, use_cache: bool = True):
+    """
+    Translate all English source files to all target languages.
+
+    With batch=True, all requests are submitted as one Claude Message Batch
+    (half the cost, but results can take minutes to hours). With bundle=True,
+    all files for a locale are translated in a single request.
+
+    Successful translations are remembered in TRANSLATION_CACHE_FILE, keyed
+    by source text, text type, system prompt, language and model, and reused
+    instead of calling Claude again. With force, new translations are still
+    recorded but never reused. Pass use_cache=False to always call Claude.
+    """
+    if batch and bundle:
+        print("Error: batch and bundle modes cannot be combined")
+        return
+
     base_dir = base_dir or get_script_dir()
     sources = load_english_source(base_dir)
 
@@ -196,13 +932,6 @@ def translate_all(base_dir: Path = None, force: bool = False, only: str = None):
         print("No source files found in en/ directory")
         return
 
-    text_types = {
-        "new.txt": "What's New / Release Notes",
-        "desc.txt": "App Description",
-        "promo.txt": "Promotional Text",
-        "keywords.txt": "App Store Keywords (comma-separated search terms)"
-    }
-
     only_locale = None
     only_file = None
     if only:
@@ -211,100 +940,149 @@ def translate_all(base_dir: Path = None, force: bool = False, only: str = None):
         else:
             only_locale = only
 
-    locale_folders = [
-        d for d in base_dir.iterdir()
-        if d.is_dir() and d.name in config.FOLDER_TO_LOCALE and d.name != "en"
-    ]
+    locale_folders = find_locale_folders(base_dir)
 
     if only_locale:
-        locale_folders = [d for d in locale_folders if d.name == only_locale]
+        locale_folders = [(d, code) for d, code in locale_folders if d.name == only_locale]
         if not locale_folders:
             print(f"Error: Locale '{only_locale}' not found")
             return
 
+    files_to_process = list(sources.items())
+    if only_file:
+        files_to_process = [(f, s) for f, s in files_to_process if f == only_file]
+        if not files_to_process:
+            print(f"Error: File '{only_file}' not found in sources")
+            return
+
     results = {"success": [], "failure": [], "skipped": []}
+    translated_folders = set()
+    cache = open_translation_cache(base_dir) if use_cache else None
+
+    # Decide what needs translating, then send every request concurrently.
+    # Jobs are ordered file by file so each source text stays warm in
+    # Claude's prompt cache while all of its locales are translated.
+    jobs = []
+    locale_translations = {
+        locale_folder.name: (locale_folder, {}) for locale_folder, _ in locale_folders
+    }
 
-    for locale_folder in sorted(locale_folders):
-        folder_name = locale_folder.name
-        locale_code = config.FOLDER_TO_LOCALE.get(folder_name)
-        locale_name = config.LOCALE_NAMES.get(locale_code, folder_name)
+    for filename, source_text in files_to_process:
+        text_type = TEXT_TYPES.get(filename, "App Store text")
+        char_limit = config.CHAR_LIMITS.get(filename)
 
-        print(f"\n{'='*50}")
-        print(f"Translating to {locale_name} ({folder_name})")
+        print("\n" + BAR)
+        print(f"Translating {filename} ({text_type})" + (f", limit: {char_limit} chars" if char_limit else ""))
         if force:
             print("(--force: retranslating all)")
-        print('='*50)
+        print(BAR)
 
-        full_translations = {}
-        any_translated = False
-
-        files_to_process = sources.items()
-        if only_file:
-            files_to_process = [(f, s) for f, s in sources.items() if f == only_file]
-            if not files_to_process:
-                print(f"  Error: File '{only_file}' not found in sources")
-                continue
-
-        for filename, source_text in files_to_process:
-            text_type = text_types.get(filename, "App Store text")
-            char_limit = config.CHAR_LIMITS.get(filename)
+        for locale_folder, locale_code in locale_folders:
+            folder_name = locale_folder.name
+            locale_name = config.LOCALE_NAMES.get(locale_code, folder_name)
+            full_translations = locale_translations[folder_name][1]
             output_path = locale_folder / filename
 
             if not force:
-                needs_translation, reason = check_file_needs_translation(output_path, char_limit)
+                needs_translation, reason, existing = check_file_needs_translation(output_path, char_limit)
                 if not needs_translation:
-                    print(f"\n  Skipping {filename}: {reason}")
+                    print(f"  Skipping {locale_name} ({folder_name}): {reason}")
                     results["skipped"].append(f"{folder_name}/{filename}: {reason}")
-                    if output_path.exists():
-                        full_translations[filename] = {
-                            "translation": output_path.read_text(encoding="utf-8").strip(),
-                            "considerations": "Existing translation (skipped)"
-                        }
+                    full_translations[filename] = {
+                        "translation": existing,
+                        "considerations": "Existing translation (skipped)"
+                    }
                     continue
                 else:
-                    print(f"\n  Translating {filename}: {reason}" + (f" (limit: {char_limit})" if char_limit else ""))
+                    print(f"  Queued {locale_name} ({folder_name}): {reason}")
             else:
-                print(f"\n  Translating {filename}..." + (f" (limit: {char_limit} chars)" if char_limit else ""))
+                print(f"  Queued {locale_name} ({folder_name})")
+
+            cached = None
+            if cache and not force:
+                cached = get_cached_translation(cache, source_text, locale_name, text_type)
+            if cached and not (char_limit and len(cached["translation"]) > char_limit):
+                output_path.write_text(cached["translation"], encoding="utf-8")
+                print(f"    Reused cached translation ({len(cached['translation'])} chars)")
+                full_translations[filename] = cached
+                results["success"].append(f"{folder_name}/{filename} (cached)")
+                translated_folders.add(folder_name)
+                continue
 
-            try:
-                result = translate_with_claude(
-                    source_text,
-                    locale_name,
-                    text_type,
-                    char_limit=char_limit,
-                    max_retries=2
-                )
+            # Reserve the slot so full_translation.json keeps source file order
+            full_translations[filename] = None
+            jobs.append({
+                "folder_name": folder_name,
+                "filename": filename,
+                "output_path": output_path,
+                "source_text": source_text,
+                "locale_name": locale_name,
+                "text_type": text_type,
+                "char_limit": char_limit,
+            })
+
+    outcomes = []
+    if jobs and batch:
+        print("\n" + BAR)
+        print(f"Submitting {len(jobs)} translation request(s) as a Message Batch")
+        print(BAR)
+        outcomes = asyncio.run(_run_translation_batch(jobs, concurrency))
+    elif jobs and bundle:
+        print("\n" + BAR)
+        print(f"Sending {len(jobs)} translation(s) bundled per locale, up to {concurrency} at a time")
+        print(BAR)
+        outcomes = asyncio.run(_run_translation_bundles(jobs, concurrency))
+    elif jobs:
+        print("\n" + BAR)
+        print(f"Sending {len(jobs)} translation request(s), up to {concurrency} at a time")
+        print(BAR)
+        outcomes = asyncio.run(_run_translation_jobs(jobs, concurrency))
+
+    for job, outcome in zip(jobs, outcomes):
+        folder_name = job["folder_name"]
+        filename = job["filename"]
+        full_translations = locale_translations[folder_name][1]
+
+        print(f"\n  {folder_name}/{filename}:")
+
+        if isinstance(outcome, Exception):
+            print(f"    Error: {outcome}")
+            full_translations[filename] = {
+                "translation": "",
+                "considerations": f"Error: {str(outcome)}"
+            }
+            results["failure"].append(f"{folder_name}/{filename}: {str(outcome)[:50]}")
+            continue
 
-                output_path.write_text(result["translation"], encoding="utf-8")
-                char_count = len(result["translation"])
-                print(f"    Saved {filename} ({char_count} chars)")
+        char_count = len(outcome["translation"])
+        print(f"    Saved {filename} ({char_count} chars)")
 
-                full_translations[filename] = {
-                    "translation": result["translation"],
-                    "considerations": result["considerations"]
-                }
+        full_translations[filename] = {
+            "translation": outcome["translation"],
+            "considerations": outcome["considerations"]
+        }
 
-                print(f"    Considerations: {result['considerations'][:100]}...")
-                results["success"].append(f"{folder_name}/{filename}")
-                any_translated = True
+        print(f"    Considerations: {outcome['considerations'][:100]}...")
+        results["success"].append(f"{folder_name}/{filename}")
+        translated_folders.add(folder_name)
 
-            except Exception as e:
-                print(f"    Error: {e}")
-                full_translations[filename] = {
-                    "translation": "",
-                    "considerations": f"Error: {str(e)}"
-                }
-                results["failure"].append(f"{folder_name}/{filename}: {str(e)[:50]}")
+        if cache:
+            store_cached_translation(cache, job["source_text"], job["locale_name"], job["text_type"],
+                                     outcome)
+
+    if cache:
+        cache.commit()
+        cache.close()
 
-        if any_translated or force:
+    for folder_name, (locale_folder, full_translations) in locale_translations.items():
+        if folder_name in translated_folders or force:
             json_path = locale_folder / "full_translation.json"
-            with open(json_path, "w", encoding="utf-8") as f:
-                json.dump(full_translations, f, ensure_ascii=False, indent=2)
-            print(f"\n  Saved full_translation.json")
+            json_path.write_bytes(_json_dumps(full_translations))
+            print(f"\n  Saved {folder_name}/full_translation.json")
 
-    print("\n" + "="*50)
+    print("\n" + BAR)
     print("TRANSLATION SUMMARY")
-    print("="*50)
+    print(BAR)
 
     if results["success"]:
         print(f"\nTRANSLATED ({len(results['success'])}):")
@@ -325,7 +1103,7 @@ def translate_all(base_dir: Path = None, force: bool = False, only: str = None):
     else:
         print("\nFAILED: None")
 
-    print("\n" + "="*50)
+    print("\n" + BAR)
 
 
 def fix_urls(base_dir: Path = None):
@@ -340,18 +1118,23 @@ def fix_urls(base_dir: Path = None):
 
     base_dir = base_dir or get_script_dir()
 
-    locale_folders = [
-        d for d in base_dir.iterdir()
-        if d.is_dir() and d.name in config.FOLDER_TO_LOCALE and d.name != "en"
-    ]
+    locale_folders = find_locale_folders(base_dir)
 
-    print("\n" + "="*50)
+    print("\n" + BAR)
     print("FIXING URLS IN desc.txt")
-    print("="*50)
+    print(BAR)
 
     results = {"updated": [], "skipped": [], "error": []}
 
-    for locale_folder in sorted(locale_folders):
+    base_privacy = config.BASE_PRIVACY_URL
+    base_terms = config.BASE_TERMS_URL
+
+    # One pass over desc.txt for both URLs; longest first so a URL that
+    # prefixes the other can't shadow it in the alternation
+    base_urls = sorted({base_privacy, base_terms}, key=len, reverse=True)
+    url_pattern = re.compile("|".join(map(re.escape, base_urls)))
+
+    for locale_folder, _ in locale_folders:
         folder_name = locale_folder.name
         desc_file = locale_folder / "desc.txt"
 
@@ -361,13 +1144,8 @@ def fix_urls(base_dir: Path = None):
             continue
 
         content = desc_file.read_text(encoding="utf-8")
-        original_content = content
 
         # Build localized URLs by inserting locale before the path
-        base_privacy = config.BASE_PRIVACY_URL
-        base_terms = config.BASE_TERMS_URL
-
-        # Extract domain and path, insert locale
         privacy_parts = base_privacy.rsplit("/", 1)
         terms_parts = base_terms.rsplit("/", 1)
 
@@ -375,10 +1153,10 @@ def fix_urls(base_dir: Path = None):
         localized_terms = f"{terms_parts[0]}/{folder_name}/{terms_parts[1]}" if len(terms_parts) > 1 else base_terms
 
         # Replace base URLs with localized versions
-        content = content.replace(base_privacy, localized_privacy)
-        content = content.replace(base_terms, localized_terms)
+        mapping = {base_privacy: localized_privacy, base_terms: localized_terms}
+        content, replacements = url_pattern.subn(lambda m: mapping[m.group(0)], content)
 
-        if content != original_content:
+        if replacements:
             desc_file.write_text(content, encoding="utf-8")
             print(f"\n  {folder_name}: URLs updated")
             print(f"    Privacy: {localized_privacy}")
@@ -392,38 +1170,99 @@ def fix_urls(base_dir: Path = None):
                 print(f"\n  {folder_name}: No URLs found to update")
                 results["skipped"].append(folder_name)
 
-    print("\n" + "="*50)
+    print("\n" + BAR)
     print("URL FIX SUMMARY")
-    print("="*50)
+    print(BAR)
     if results["updated"]:
         print(f"\nUPDATED ({len(results['updated'])}): {', '.join(results['updated'])}")
     if results["skipped"]:
         print(f"\nSKIPPED ({len(results['skipped'])}): {', '.join(results['skipped'])}")
     if results["error"]:
         print(f"\nERROR ({len(results['error'])}): {', '.join(results['error'])}")
-    print("\n" + "="*50)
+    print("\n" + BAR)
 
 
 # =============================================================================
 # App Store Connect API Functions
 # =============================================================================
 
+# Values accepted for APP_STORE_HTTP_CLIENT
+ASC_HTTP_CLIENTS = ("httpx", "requests")
+
+# Shared client so App Store Connect calls reuse one connection; created on first use
+_asc_client = None
+_asc_client_lock = threading.Lock()
+
+
+def _get_asc_client():
+    """
+    Return the shared App Store Connect HTTP client.
+
+    Uses httpx over HTTP/2 by default; set APP_STORE_HTTP_CLIENT=requests to
+    fall back to a keep-alive requests.Session. The setting is read on first
+    use, so a value from .env is honoured.
+    """
+    global _asc_client
+    with _asc_client_lock:
+        if _asc_client is None:
+            client_name = os.environ.get("APP_STORE_HTTP_CLIENT", "httpx").strip().lower()
+            if client_name not in ASC_HTTP_CLIENTS:
+                raise ValueError(f"APP_STORE_HTTP_CLIENT must be one of "
+                                 f"{', '.join(ASC_HTTP_CLIENTS)} (got {client_name!r})")
+            if client_name == "requests":
+                _asc_client = requests.Session()
+                _asc_client.mount("https://", HTTPAdapter(pool_connections=16, pool_maxsize=16))
+                _asc_client.headers["Accept-Encoding"] = ACCEPT_ENCODING
+            else:
+                _asc_client = httpx.Client(
+                    http2=config.HAS_HTTP2,
+                    limits=httpx.Limits(max_connections=16),
+                    headers={"Accept-Encoding": ACCEPT_ENCODING},
+                    timeout=httpx.Timeout(ASC_TIMEOUT)
+                )
+        return _asc_client
+
+
+# App Store Connect JWTs are valid for 20 minutes; reuse one until a minute before it expires
+TOKEN_LIFETIME = 1200
+TOKEN_REFRESH_MARGIN = 60
+
+_token_lock = threading.Lock()
+_token_cache = {"token": None, "exp": 0, "key": None}
+_private_keys = {}
+
+
 def generate_token():
-    """Generate JWT token for App Store Connect API."""
+    """Return a JWT token for App Store Connect API, reusing the cached token while it is valid."""
     if not config.PRIVATE_KEY_PATH:
         raise ValueError("APP_STORE_PRIVATE_KEY_PATH not configured")
 
-    with open(config.PRIVATE_KEY_PATH, "r") as f:
-        private_key = f.read()
+    # A cached token is only valid for the credentials it was signed with
+    cache_key = (config.KEY_ID, config.ISSUER_ID, config.PRIVATE_KEY_PATH)
 
-    payload = {
-        "iss": config.ISSUER_ID,
-        "iat": int(time.time()),
-        "exp": int(time.time()) + 1200,
-        "aud": "appstoreconnect-v1"
-    }
+    with _token_lock:
+        now = time.time()
+        if (_token_cache["token"] and _token_cache["key"] == cache_key
+                and now < _token_cache["exp"] - TOKEN_REFRESH_MARGIN):
+            return _token_cache["token"]
+
+        private_key = _private_keys.get(config.PRIVATE_KEY_PATH)
+        if private_key is None:
+            with open(config.PRIVATE_KEY_PATH, "r") as f:
+                private_key = f.read()
+            _private_keys[config.PRIVATE_KEY_PATH] = private_key
+
+        issued_at = int(now)
+        payload = {
+            "iss": config.ISSUER_ID,
+            "iat": issued_at,
+            "exp": issued_at + TOKEN_LIFETIME,
+            "aud": "appstoreconnect-v1"
+        }
 
-    return jwt.encode(payload, private_key, algorithm="ES256", headers={"kid": config.KEY_ID})
+        token = jwt.encode(payload, private_key, algorithm="ES256", headers={"kid": config.KEY_ID})
+        _token_cache.update(token=token, exp=issued_at + TOKEN_LIFETIME, key=cache_key)
+        return token
 
 
 def api_request(method, endpoint, data=None):
@@ -434,17 +1273,17 @@ def api_request(method, endpoint, data=None):
     }
     url = f"{config.BASE_URL}{endpoint}"
 
-    response = requests.request(method, url, headers=headers, json=data)
-    if not response.ok:
+    response = _get_asc_client().request(method, url, headers=headers, json=data)
+    if response.status_code >= 400:
         try:
-            error_detail = response.json()
+            error_detail = _json_loads(response.content)
             errors = error_detail.get("errors", [])
             for err in errors:
                 print(f"      API Error: {err.get('detail', err)}")
         except:
             pass
         response.raise_for_status()
-    return response.json() if response.text else None
+    return _json_loads(response.content) if response.content else None
 
 
 def get_version(app_id, platform="IOS", version_string=None):
@@ -518,25 +1357,8 @@ def load_translations_for_upload(base_dir: Path = None):
     translations = {}
 
     for folder_name, locale_code in config.FOLDER_TO_LOCALE.items():
-        folder_path = base_dir / folder_name
-        if not folder_path.exists():
-            continue
-
-        locale_data = {}
-
-        new_file = folder_path / "new.txt"
-        desc_file = folder_path / "desc.txt"
-        promo_file = folder_path / "promo.txt"
-        keywords_file = folder_path / "keywords.txt"
-
-        if new_file.exists():
-            locale_data["whats_new"] = new_file.read_text(encoding="utf-8").strip()
-        if desc_file.exists():
-            locale_data["description"] = desc_file.read_text(encoding="utf-8").strip()
-        if promo_file.exists():
-            locale_data["promotional_text"] = promo_file.read_text(encoding="utf-8").strip()
-        if keywords_file.exists():
-            locale_data["keywords"] = keywords_file.read_text(encoding="utf-8").strip()
+        files = read_locale_files(base_dir / folder_name)
+        locale_data = {FILE_TO_FIELD[filename]: text for filename, text in files.items()}
 
         if locale_data:
             translations[locale_code] = locale_data
@@ -553,6 +1375,9 @@ FIELD_MAP = {
 
 ALL_FIELDS = list(FIELD_MAP.keys())
 
+# Maximum number of locales uploaded to App Store Connect at once
+UPLOAD_WORKERS = 8
+
 
 def send_to_app_store(ios_version=None, mac_version=None, fields=None, base_dir: Path = None):
     """Send translations to App Store Connect for iOS and/or macOS."""
@@ -580,9 +1405,9 @@ def send_to_app_store(ios_version=None, mac_version=None, fields=None, base_dir:
     print(f"Uploading fields: {', '.join(fields)}")
 
     for platform, app_id, version_string in platforms:
-        print(f"\n{'='*50}")
+        print("\n" + BAR)
         print(f"Uploading to {platform} version {version_string} (App ID: {app_id})")
-        print('='*50)
+        print(BAR)
 
         try:
             version_id = get_version(app_id, platform, version_string)
@@ -592,17 +1417,18 @@ def send_to_app_store(ios_version=None, mac_version=None, fields=None, base_dir:
 
             existing_locs = get_localizations(version_id)
 
-            for locale, content in translations.items():
+            def _update_one(locale, content):
+                """Create or update one locale; returns its log lines."""
                 locale_name = config.LOCALE_NAMES.get(locale, locale)
-                print(f"\n  Processing {locale_name} ({locale})...")
+                log = [f"\n  Processing {locale_name} ({locale})..."]
 
                 try:
                     if locale in existing_locs:
                         loc_id = existing_locs[locale]
-                        print(f"    Updating existing localization...")
+                        log.append(f"    Updating existing localization...")
                     else:
                         loc_id = create_localization(version_id, locale)
-                        print(f"    Created new localization...")
+                        log.append(f"    Created new localization...")
 
                     update_localization(
                         loc_id,
@@ -611,17 +1437,35 @@ def send_to_app_store(ios_version=None, mac_version=None, fields=None, base_dir:
                         whats_new=content.get("whats_new") if "whats_new" in field_keys else None,
                         keywords=content.get("keywords") if "keywords" in field_keys else None
                     )
-                    print(f"    Updated successfully")
+                    log.append(f"    Updated successfully")
 
                 except Exception as e:
-                    print(f"    Error: {e}")
+                    log.append(f"    Error: {e}")
+
+                return log
+
+            # Locales are independent, so upload them concurrently over the shared session
+            with ThreadPoolExecutor(max_workers=UPLOAD_WORKERS) as executor:
+                futures = [executor.submit(_update_one, locale, content)
+                           for locale, content in translations.items()]
+                for future in as_completed(futures):
+                    print("\n".join(future.result()))
 
         except Exception as e:
             print(f"  Platform error: {e}")
 
-    print("\n" + "="*50)
+    print("\n" + BAR)
     print("Upload complete!")
-    print("="*50)
+    print(BAR)
+
+
+def use_fast_event_loop():
+    """Run asyncio on uvloop when it is installed; otherwise keep the default loop."""
+    try:
+        import uvloop
+    except ImportError:
+        return
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
 
 
 def main():
@@ -641,6 +1485,15 @@ def main():
                         help="Force retranslate all files")
     parser.add_argument("--only", type=str,
                         help="Only translate specific locale or file (e.g., 'de' or 'de/promo.txt')")
+    parser.add_argument("--concurrency", type=int, default=DEFAULT_CONCURRENCY,
+                        help=f"Maximum concurrent translation requests (default: {DEFAULT_CONCURRENCY})")
+    parser.add_argument("--no-cache", action="store_true",
+                        help="Don't reuse or record cached translations")
+    translate_mode = parser.add_mutually_exclusive_group()
+    translate_mode.add_argument("--batch", action="store_true",
+                                help="Translate via the Claude Message Batches API (50%% cheaper, slower)")
+    translate_mode.add_argument("--bundle", action="store_true",
+                                help="Translate all files for a locale in a single request")
     parser.add_argument("--fields", type=str, nargs="+",
                         choices=["new", "desc", "promo", "keywords", "all"],
                         help="Which fields to upload")
@@ -651,6 +1504,9 @@ def main():
 
     args = parser.parse_args()
 
+    if args.concurrency < 1:
+        parser.error("--concurrency must be at least 1")
+
     # Load configuration
     if args.env:
         config.load_config(args.env)
@@ -659,9 +1515,9 @@ def main():
 
     if not args.translate and not args.send and not args.fix_urls:
         parser.print_help()
-        print("\n" + "="*50)
+        print("\n" + BAR)
         print("QUICK START")
-        print("="*50)
+        print(BAR)
         print("""
 1. Create .env file with required API keys
 2. Create en/ folder with source text files:
@@ -676,7 +1532,9 @@ def main():
         return
 
     if args.translate:
-        translate_all(force=args.force, only=args.only)
+        use_fast_event_loop()
+        translate_all(force=args.force, only=args.only, concurrency=args.concurrency,
+                      batch=args.batch, bundle=args.bundle, use_cache=not args.no_cache)
 
     if args.fix_urls:
         fix_urls()
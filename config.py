@@ -3,10 +3,14 @@ Configuration module for localization-connect.
 
 All settings are loaded from environment variables or can be overridden programmatically.
 """
+import importlib.util
 import os
 from pathlib import Path
 from dotenv import load_dotenv
 
+# HTTP/2 needs the optional h2 package (pip install "httpx[http2]")
+HAS_HTTP2 = importlib.util.find_spec("h2") is not None
+
 # Load .env file from current directory or specified path
 def load_config(env_path: str = None):
     """Load environment variables from .env file."""
@@ -26,11 +30,36 @@ BASE_URL = "https://api.appstoreconnect.apple.com/v1"
 # Claude API Configuration (required for --translate)
 CLAUDE_API_KEY = os.environ.get("CLAUDE_API_KEY", "")
 CLAUDE_API_URL = "https://api.anthropic.com/v1/messages"
+CLAUDE_BATCH_API_URL = "https://api.anthropic.com/v1/messages/batches"
 CLAUDE_MODEL = os.environ.get("CLAUDE_MODEL", "claude-sonnet-4-20250514")
 
 # Google API Configuration (required for screenshot translation)
 GOOGLE_API_KEY = os.environ.get("GOOGLE_API_KEY", "")
 GEMINI_MODEL = os.environ.get("GEMINI_MODEL", "models/gemini-2.0-flash")
+# Maximum Gemini requests in flight; keep below your tier's RPM/IPM limit
+DEFAULT_GEMINI_CONCURRENCY = 8
+
+
+def gemini_concurrency() -> int:
+    """
+    Return GEMINI_CONCURRENCY from the environment.
+
+    Read on each call so a value from .env is honoured; falls back to
+    DEFAULT_GEMINI_CONCURRENCY when it is unset, not a number, or below 1.
+    """
+    value = os.environ.get("GEMINI_CONCURRENCY", "").strip()
+    if not value:
+        return DEFAULT_GEMINI_CONCURRENCY
+    try:
+        concurrency = int(value)
+    except ValueError:
+        concurrency = 0
+    if concurrency < 1:
+        print(f"Ignoring GEMINI_CONCURRENCY={value!r}: must be a whole number of at least 1; "
+              f"using {DEFAULT_GEMINI_CONCURRENCY}")
+        return DEFAULT_GEMINI_CONCURRENCY
+    return concurrency
+
 
 # Folder name to App Store Connect locale mapping
 FOLDER_TO_LOCALE = {
@@ -47,6 +76,9 @@ FOLDER_TO_LOCALE = {
     "ru": "ru",
 }
 
+# Folders that hold translations (every locale except the English source)
+FOLDER_NAMES = frozenset(FOLDER_TO_LOCALE) - {"en"}
+
 # Human-readable locale names
 LOCALE_NAMES = {
     "en-US": "English (U.S.)",
@@ -4,6 +4,7 @@ Resize screenshots to App Store dimensions.
 
 Usage:
     python resize_screenshots.py [--ios|--ipad|--mac] [--local] [--dry-run]
+    python resize_screenshots.py --check-env
 
 Default is --ios (iPhone). Use --local to process current and parent dir
 instead of language subdirs.
@@ -11,11 +12,35 @@ instead of language subdirs.
 REQUIREMENTS
 ------------
     pip install Pillow
+
+For several times faster resizing, install pillow-simd built against
+libjpeg-turbo in its place:
+    pip uninstall -y Pillow
+    conda install -yc conda-forge libjpeg-turbo   # or your OS's libjpeg-turbo dev package
+    CFLAGS="${CFLAGS} -mavx2" pip install --upgrade --no-cache-dir --force-reinstall \
+        --no-binary :all: --compile pillow-simd
+
+Run with --check-env to see which libraries Pillow is using.
 """
 
 import argparse
+import os
+import re
+import struct
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from PIL import Image
+
+import PIL
+from PIL import Image, features
+
+PNG_SIGNATURE = b"\x89PNG\r\n\x1a\n"
+
+# Screenshot file types that get resized
+SCREENSHOT_SUFFIXES = {".png", ".jpg", ".jpeg"}
+
+# Device keywords in screenshot filenames, in priority order
+_DEVICE_RE = re.compile(r"mac|ipad|iphone|ios", re.IGNORECASE)
+_DEVICE_PRIORITY = ("mac", "ipad", "ios")
 
 # Target sizes by device type
 SIZES = {
@@ -42,75 +67,213 @@ SIZES = {
 }
 
 
+# (aspect ratio, size) for each device's target sizes, computed once
+_TARGET_RATIOS = {
+    device: [(w / h, (w, h)) for w, h in sizes]
+    for device, sizes in SIZES.items()
+}
+
+
+def uses_pillow_simd() -> bool:
+    """Return True if the installed Pillow is pillow-simd (versioned like 9.0.0.post1)."""
+    version = PIL.__version__.lower()
+    return ".post" in version or "simd" in version
+
+
+def uses_libjpeg_turbo() -> bool:
+    """Return True if Pillow's JPEG support comes from libjpeg-turbo."""
+    try:
+        return bool(features.check_feature("libjpeg_turbo"))
+    except ValueError:
+        # Pillow too old to report it
+        return False
+
+
+def check_env():
+    """Print Pillow's build details and warn about slow imaging libraries."""
+    features.pilinfo(supported_formats=False)
+
+    print(f"pillow-simd: {'yes' if uses_pillow_simd() else 'no'}")
+    print(f"libjpeg-turbo: {'yes' if uses_libjpeg_turbo() else 'no'}")
+
+    if not uses_libjpeg_turbo():
+        print("\nWarning: Pillow is not using libjpeg-turbo; JPEG screenshots will be 2-7x slower")
+        print("See the REQUIREMENTS section of resize_screenshots.py")
+
+
 def get_device_type(filename: str) -> str | None:
     """Get device type from filename (ios, ipad, mac) or None if not recognized."""
-    name = filename.lower()
-    if "mac" in name:
-        return "mac"
-    if "ipad" in name:
-        return "ipad"
-    if "ios" in name or "iphone" in name:
-        return "ios"
+    found = {match.lower() for match in _DEVICE_RE.findall(filename)}
+    if "iphone" in found:
+        found.add("ios")
+    for device in _DEVICE_PRIORITY:
+        if device in found:
+            return device
     return None
 
 
-def find_closest_size(width: int, height: int, target_sizes: list) -> tuple:
-    """Find the target size with the closest aspect ratio."""
+def find_closest_size(width: int, height: int, device: str) -> tuple:
+    """Find the device's target size with the closest aspect ratio."""
     current_ratio = width / height
+    _, best_size = min(
+        _TARGET_RATIOS[device], key=lambda target: abs(current_ratio - target[0])
+    )
+    return best_size
 
-    best_size = None
-    best_diff = float('inf')
 
-    for target_w, target_h in target_sizes:
-        target_ratio = target_w / target_h
-        diff = abs(current_ratio - target_ratio)
+def _image_size(path: Path) -> tuple:
+    """
+    Get an image's (width, height), reading PNGs straight from their IHDR chunk.
 
-        if diff < best_diff:
-            best_diff = diff
-            best_size = (target_w, target_h)
+    The IHDR is always the first chunk, so its width and height sit at bytes
+    16-24. Other formats (and mislabelled files) fall back to Pillow.
+    """
+    with open(path, "rb") as f:
+        header = f.read(24)
 
-    return best_size
+    if len(header) == 24 and header[:8] == PNG_SIGNATURE and header[12:16] == b"IHDR":
+        return struct.unpack(">II", header[16:24])
 
+    with Image.open(path) as img:
+        return img.size
 
-def resize_image(input_path: Path, output_path: Path, target_size: tuple):
-    """Resize image to target size."""
-    with Image.open(input_path) as img:
-        resized = img.resize(target_size, Image.Resampling.LANCZOS)
-        resized.save(output_path, "PNG", optimize=True)
 
+def needs_trim_only(src_size: tuple, dst_size: tuple) -> bool:
+    """Return True if the target is at most 1px smaller in each dimension, so a crop is enough."""
+    return all(0 <= src - dst <= 1 for src, dst in zip(src_size, dst_size))
 
-def process_directory(lang_dir: Path, device: str, dry_run: bool = False):
-    """Process PNGs in a language directory based on device type."""
-    png_files = list(lang_dir.glob("*.png"))
-    target_sizes = SIZES[device]
 
-    for png_path in png_files:
-        file_device = get_device_type(png_path.name)
+def choose_resample(src_size: tuple, dst_size: tuple) -> Image.Resampling:
+    """Pick BILINEAR for resizes within 2px of the target, LANCZOS otherwise."""
+    src_w, src_h = src_size
+    dst_w, dst_h = dst_size
+
+    if abs(src_w - dst_w) <= 2 and abs(src_h - dst_h) <= 2:
+        return Image.Resampling.BILINEAR
+    return Image.Resampling.LANCZOS
+
 
-        # Skip files that don't match the target device
-        if file_device != device:
-            print(f"  Skipping {png_path.name} ({file_device or 'unknown'} shot)")
-            continue
+def _prescale_size(src_size: tuple, dst_size: tuple) -> tuple | None:
+    """Return twice the target size for downscales of more than 2x, or None."""
+    src_w, src_h = src_size
+    dst_w, dst_h = dst_size
+
+    if min(src_w / dst_w, src_h / dst_h) > 2:
+        return (dst_w * 2, dst_h * 2)
+    return None
 
-        with Image.open(png_path) as img:
-            orig_size = img.size
 
-        # Skip if already a target size
-        if orig_size in target_sizes:
-            print(f"  Skipping {png_path.name}: already at target size {orig_size}")
-            continue
+def _drop_opaque_alpha(img: Image.Image) -> Image.Image:
+    """Convert RGBA images whose alpha is fully opaque to RGB."""
+    if img.mode == "RGBA" and img.getchannel("A").getextrema() == (255, 255):
+        return img.convert("RGB")
+    return img
 
-        target_size = find_closest_size(*orig_size, target_sizes)
 
-        if dry_run:
-            print(f"  {png_path.name}: {orig_size} -> {target_size}")
+def resize_image(input_path: Path, output_path: Path, target_size: tuple,
+                 compress_level: int = 1, optimize: bool = False):
+    """
+    Resize image to target size.
+
+    PNGs are written with fast zlib compression by default; App Store Connect
+    recompresses uploads anyway. optimize=True trades encode time for the
+    smallest file (compression level 9 plus Pillow's optimizer). JPEGs are
+    saved as JPEG at quality 95.
+    """
+    with Image.open(input_path) as source:
+        img = _drop_opaque_alpha(source)
+        prescale_size = _prescale_size(img.size, target_size)
+
+        if needs_trim_only(img.size, target_size):
+            resized = img.crop((0, 0, *target_size))
+        elif prescale_size:
+            # JPEG only: let the decoder scale down by DCT while loading
+            img.draft(img.mode, prescale_size)
+            resized = img.resize(prescale_size, Image.Resampling.BOX)
+            resized = resized.resize(target_size, Image.Resampling.LANCZOS)
         else:
-            print(f"  Resizing {png_path.name}: {orig_size} -> {target_size}")
-            resize_image(png_path, png_path, target_size)
+            resized = img.resize(target_size, choose_resample(img.size, target_size))
+        _save_image(resized, output_path, compress_level, optimize)
+
+
+def _save_image(img: Image.Image, output_path: Path, compress_level: int = 1,
+                optimize: bool = False):
+    """Save img in the format its file extension calls for."""
+    if Path(output_path).suffix.lower() in (".jpg", ".jpeg"):
+        # Keep the colour profile and metadata; JPEG doesn't carry them over by default
+        img.save(output_path, "JPEG", quality=95, optimize=optimize,
+                 icc_profile=img.info.get("icc_profile"), exif=img.info.get("exif", b""))
+    elif optimize:
+        img.save(output_path, "PNG", optimize=True, compress_level=9)
+    else:
+        img.save(output_path, "PNG", compress_level=compress_level)
+
+
+def _resize_one(image_path: Path, device: str, dry_run: bool = False,
+                compress_level: int = 1, optimize: bool = False) -> str:
+    """Resize a single screenshot if needed and return its log line."""
+    target_sizes = SIZES[device]
+    orig_size = _image_size(image_path)
+
+    # Skip if already a target size
+    if orig_size in target_sizes:
+        return f"  Skipping {image_path.name}: already at target size {orig_size}"
+
+    # A near-match of any target is trimmed to it, even if the aspect-ratio
+    # pick would choose a different size
+    target_size = next((size for size in target_sizes if needs_trim_only(orig_size, size)), None)
+    trim = target_size is not None
+    if not trim:
+        target_size = find_closest_size(*orig_size, device)
+
+    if dry_run:
+        note = " (trim)" if trim else ""
+        return f"  {image_path.name}: {orig_size} -> {target_size}{note}"
+
+    resize_image(image_path, image_path, target_size, compress_level, optimize)
+    return f"  {'Trimmed' if trim else 'Resized'} {image_path.name}: {orig_size} -> {target_size}"
+
+
+def process_directory(lang_dir: Path, device: str, dry_run: bool = False,
+                      executor: ThreadPoolExecutor = None,
+                      compress_level: int = 1, optimize: bool = False):
+    """Process screenshots (PNG or JPEG) in a language directory based on device type.
+
+    Files are resized in parallel; Pillow releases the GIL while resampling
+    and encoding, so threads scale with the number of cores. Pass an
+    existing executor to share one pool across several directories.
+    """
+    if executor is None:
+        with ThreadPoolExecutor(max_workers=os.cpu_count()) as ex:
+            process_directory(lang_dir, device, dry_run, ex, compress_level, optimize)
+        return
+
+    with os.scandir(lang_dir) as entries:
+        all_files = sorted(
+            Path(entry.path) for entry in entries
+            if os.path.splitext(entry.name)[1].lower() in SCREENSHOT_SUFFIXES and entry.is_file()
+        )
+
+    # Skip files that don't match the target device before touching them
+    image_files = [p for p in all_files if get_device_type(p.name) == device]
+    skipped = len(all_files) - len(image_files)
+    if skipped:
+        print(f"  Skipping {skipped} non-{device} screenshot{'s' if skipped != 1 else ''}")
+
+    if not image_files:
+        return
+
+    # map() yields in submission order, so the log stays grouped per file
+    def resize(image_path):
+        return _resize_one(image_path, device, dry_run, compress_level, optimize)
+
+    for line in executor.map(resize, image_files):
+        print(line)
 
 
 def resize_screenshots(base_dir: Path = None, device: str = "ios",
-                       local: bool = False, dry_run: bool = False):
+                       local: bool = False, dry_run: bool = False,
+                       compress_level: int = 1, optimize: bool = False):
     """
     Resize screenshots in the given directory.
 
@@ -119,33 +282,39 @@ def resize_screenshots(base_dir: Path = None, device: str = "ios",
         device: Device type - "ios", "ipad", or "mac"
         local: If True, process current and parent dir; otherwise process language subdirs
         dry_run: If True, preview without modifying files
+        compress_level: zlib level (0-9) for resized PNGs; 1 is fast with slightly larger files
+        optimize: If True, write the smallest PNGs possible (slow; overrides compress_level)
     """
     base_dir = base_dir or Path.cwd()
 
     if dry_run:
         print("DRY RUN - No files will be modified\n")
 
+    if not dry_run and not uses_pillow_simd():
+        print("Note: Resizing is several times faster with pillow-simd (see README)\n")
+
     print(f"Device: {device.upper()}")
     print(f"Target sizes: {SIZES[device]}\n")
 
     if local:
         dirs_to_process = [base_dir, base_dir.parent]
-        for d in dirs_to_process:
-            print(f"\nProcessing {d.name}/")
-            process_directory(d, device, dry_run)
     else:
-        lang_dirs = [
-            d for d in base_dir.iterdir()
-            if d.is_dir() and not d.name.startswith(".") and d.name != ".venv"
-        ]
+        with os.scandir(base_dir) as entries:
+            dirs_to_process = sorted(
+                Path(entry.path) for entry in entries
+                if not entry.name.startswith(".") and entry.is_dir()
+            )
 
-        if not lang_dirs:
+        if not dirs_to_process:
             print("No language directories found.")
             return
 
-        for lang_dir in sorted(lang_dirs):
-            print(f"\nProcessing {lang_dir.name}/")
-            process_directory(lang_dir, device, dry_run)
+    # One pool for the whole run; directories are walked in order so each
+    # one's output stays under its own heading
+    with ThreadPoolExecutor(max_workers=os.cpu_count()) as executor:
+        for d in dirs_to_process:
+            print(f"\nProcessing {d.name}/")
+            process_directory(d, device, dry_run, executor, compress_level, optimize)
 
     print("\nDone!")
 
@@ -158,8 +327,18 @@ def main():
     parser.add_argument("--local", action="store_true",
                         help="Process current dir and parent dir instead of language subdirs")
     parser.add_argument("--dry-run", action="store_true", help="Preview without modifying")
+    parser.add_argument("--compress-level", type=int, default=1, choices=range(10),
+                        metavar="0-9", help="PNG compression level (default: 1, fastest)")
+    parser.add_argument("--optimize", action="store_true",
+                        help="Write the smallest PNGs possible (slow; implies level 9)")
+    parser.add_argument("--check-env", action="store_true",
+                        help="Show Pillow's build details (libjpeg-turbo, pillow-simd) and exit")
     args = parser.parse_args()
 
+    if args.check_env:
+        check_env()
+        return
+
     if args.mac:
         device = "mac"
     elif args.ipad:
@@ -167,7 +346,8 @@ def main():
     else:
         device = "ios"
 
-    resize_screenshots(device=device, local=args.local, dry_run=args.dry_run)
+    resize_screenshots(device=device, local=args.local, dry_run=args.dry_run,
+                       compress_level=args.compress_level, optimize=args.optimize)
 
 
 if __name__ == "__main__":
@@ -16,26 +16,45 @@ Required in .env file:
 
 Optional:
     GEMINI_MODEL=models/gemini-2.0-flash
+    GEMINI_CONCURRENCY=8    # Requests in flight; keep below your RPM/IPM limit
 
 USAGE
 -----
     python translate_screenshots.py                  # Translate all PNGs
     python translate_screenshots.py --force          # Overwrite existing
     python translate_screenshots.py --languages de ja ko  # Specific languages
+    python translate_screenshots.py --concurrency 4  # Fewer requests in flight
+    python translate_screenshots.py --batch          # Half price, results within 24h
+    python translate_screenshots.py --no-cache       # Don't reuse or record earlier results
 """
 
 import argparse
+import asyncio
+import base64
+import functools
+import hashlib
 import io
+import json
+import os
+import random
+import sqlite3
+import sys
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 
+import httpx
+
 try:
     from google import genai
-    from google.genai import types
+    from google.genai import errors, types
 except ImportError:
     genai = None
+    errors = None
     types = None
 
-from PIL import Image
+from PIL import Image, features
 
 from . import config
 
@@ -50,59 +69,465 @@ DEFAULT_LANGUAGES = {
     "pt-BR": "Portuguese (Brazil)"
 }
 
+# Shared instruction for every screenshot; each request only adds its target language
+SYSTEM_INSTRUCTION = """These are App Store screenshots with English text.
+Recreate each image exactly but translate ALL English text to the target language given with it.
+Keep the exact same layout, colors, fonts, and design - only change the language of the text."""
+
+# Source screenshots are shrunk to this many pixels on the long edge before
+# upload; Gemini generates at its own resolution regardless of input size
+SOURCE_MAX_EDGE = 1024
+SOURCE_WEBP_QUALITY = 85
+
+# Rate-limit (429) and server (5xx) errors are retried with exponential
+# backoff and jitter, waiting at most RETRY_MAX_WAIT seconds between attempts
+MAX_ATTEMPTS = 6
+RETRY_MAX_WAIT = 60
+
+# Cache of earlier translations kept next to the source screenshots (disable with --no-cache)
+SCREENSHOT_CACHE_FILE = ".translate_cache.sqlite"
+
+# Permissions for new files, as open() would apply them (os.umask can only be read by setting it)
+_UMASK = os.umask(0)
+os.umask(_UMASK)
+
+# Seconds between status checks while waiting for a batch job
+BATCH_POLL_INTERVAL = 30
+
+# Consecutive failed status checks tolerated before giving up on a batch job
+BATCH_POLL_RETRIES = 5
+
+# Batch job states after which the job won't change again
+BATCH_DONE_STATES = {
+    "JOB_STATE_SUCCEEDED",
+    "JOB_STATE_PARTIALLY_SUCCEEDED",
+    "JOB_STATE_FAILED",
+    "JOB_STATE_CANCELLED",
+    "JOB_STATE_EXPIRED",
+}
+
 
 def get_png_files(directory: Path) -> list:
     """Get all PNG files in the directory."""
     return list(directory.glob("*.png"))
 
 
-def translate_image(client, image_path: Path, language_code: str, language_name: str):
-    """Send image to Gemini and get translated version back."""
-    image = Image.open(image_path)
+def encode_source_image(image_path: Path) -> tuple:
+    """
+    Shrink a source screenshot for upload and return (image bytes, mime type).
 
-    prompt = f"""This is an App Store screenshot with English text.
-Recreate this exact image but translate ALL English text to {language_name}.
-Keep the exact same layout, colors, fonts, and design - only change the language of the text."""
+    Images are scaled to SOURCE_MAX_EDGE on the long edge and encoded as
+    WEBP, which is far smaller than PNG for screenshots and cuts upload size
+    and input tokens. Falls back to PNG if Pillow lacks WEBP support. Cached
+    until the file changes, since each screenshot is sent once per target
+    language; translate_screenshots() clears the cache when it finishes.
+    """
+    stat = image_path.stat()
+    return _encode_source_image(image_path, stat.st_mtime_ns, stat.st_size)
 
-    try:
-        response = client.models.generate_content(
+
+@functools.lru_cache(maxsize=None)
+def _encode_source_image(image_path: Path, mtime_ns: int, size: int) -> tuple:
+    with Image.open(image_path) as image:
+        scale = SOURCE_MAX_EDGE / max(image.size)
+        if scale < 1:
+            new_size = (round(image.width * scale), round(image.height * scale))
+            image = image.resize(new_size, Image.Resampling.LANCZOS)
+
+        buffer = io.BytesIO()
+        if features.check("webp"):
+            image.save(buffer, "WEBP", quality=SOURCE_WEBP_QUALITY)
+            return buffer.getvalue(), "image/webp"
+        image.save(buffer, "PNG")
+        return buffer.getvalue(), "image/png"
+
+
+def build_prompt(language_name: str) -> str:
+    """Build the per-request text sent alongside each screenshot."""
+    return f"Target language: {language_name}"
+
+
+def _generate_config():
+    """
+    Build the GenerateContentConfig shared by every request in a run.
+
+    The instruction is sent inline: at a few dozen tokens it is far below the
+    minimum size Gemini's context caching accepts.
+    """
+    return types.GenerateContentConfig(temperature=0.4, system_instruction=SYSTEM_INSTRUCTION)
+
+
+def _is_retryable(error: Exception) -> bool:
+    """Return True for Gemini errors worth retrying (rate limits and server errors)."""
+    if errors is None or not isinstance(error, errors.APIError):
+        return False
+    code = error.code or 0
+    return code == 429 or code >= 500
+
+
+def _retry_hints(error: Exception) -> tuple:
+    """
+    Extract (retry delay in seconds, quota id) from a Gemini API error.
+
+    Either value is None when the error doesn't say. The delay comes from a
+    Retry-After header or the RetryInfo detail; the quota id (e.g.
+    GenerateRequestsPerMinutePerProjectPerModel) from QuotaFailure.
+    """
+    delay = None
+    quota = None
+
+    headers = getattr(getattr(error, "response", None), "headers", None) or {}
+    retry_after = headers.get("retry-after")
+    if retry_after:
+        try:
+            delay = float(retry_after)
+        except ValueError:
+            pass
+
+    body = error.details if isinstance(error.details, dict) else {}
+    for detail in body.get("error", {}).get("details", []):
+        detail_type = detail.get("@type", "")
+        if detail_type.endswith("RetryInfo") and delay is None:
+            try:
+                delay = float(detail.get("retryDelay", "").rstrip("s"))
+            except ValueError:
+                pass
+        elif detail_type.endswith("QuotaFailure"):
+            ids = [v.get("quotaId") for v in detail.get("violations", []) if v.get("quotaId")]
+            quota = ", ".join(ids) or None
+
+    return delay, quota
+
+
+async def _with_retry(call, label: str):
+    """Await call(), retrying Gemini rate-limit and server errors with backoff and jitter."""
+    for attempt in range(1, MAX_ATTEMPTS + 1):
+        try:
+            return await call()
+        except Exception as e:
+            if attempt == MAX_ATTEMPTS or not _is_retryable(e):
+                raise
+
+            delay, quota = _retry_hints(e)
+            wait = min(max(delay or 0, random.uniform(0, 2 ** attempt)), RETRY_MAX_WAIT)
+            reason = f"{e.code} {e.status}"
+            if quota:
+                reason += f", quota: {quota}"
+            print(f"  Retry {attempt}/{MAX_ATTEMPTS - 1} for {label} in {wait:.1f}s ({reason})")
+            await asyncio.sleep(wait)
+
+
+def save_image_data(output_path: Path, data: bytes, mime_type: str = "image/png"):
+    """
+    Write generated image data to output_path atomically.
+
+    PNG data is written as-is; other formats are converted to PNG with fast
+    compression. The file is written next to output_path and renamed into
+    place, so an interrupted run never leaves a truncated screenshot behind.
+    """
+    with tempfile.NamedTemporaryFile(dir=output_path.parent, suffix=".tmp", delete=False) as tmp:
+        try:
+            if mime_type == "image/png":
+                tmp.write(data)
+            else:
+                with Image.open(io.BytesIO(data)) as img:
+                    img.save(tmp, "PNG", compress_level=1)
+        except BaseException:
+            tmp.close()
+            os.unlink(tmp.name)
+            raise
+    # NamedTemporaryFile is owner-only; give the file the usual umask permissions
+    os.chmod(tmp.name, 0o666 & ~_UMASK)
+    os.replace(tmp.name, output_path)
+
+
+async def translate_image(client, image_path: Path, output_path: Path, language_code: str,
+                          language_name: str, generate_config=None,
+                          executor: ProcessPoolExecutor = None) -> bool:
+    """
+    Send image to Gemini and save the translated version to output_path.
+
+    The response is streamed and the first image part is written straight to
+    disk, without decoding it. Images that come back in another format need a
+    CPU-bound PNG encode; pass a process pool as executor to run those off
+    the event loop's process. Returns True if an image was saved.
+    """
+    image_data, mime_type = await asyncio.to_thread(encode_source_image, image_path)
+    image_part = types.Part.from_bytes(data=image_data, mime_type=mime_type)
+    prompt = build_prompt(language_name)
+
+    async def stream_to_file():
+        stream = await client.aio.models.generate_content_stream(
             model=config.GEMINI_MODEL,
-            contents=[prompt, image],
-            config=types.GenerateContentConfig(
-                temperature=0.4,
-            )
+            contents=[prompt, image_part],
+            config=generate_config or _generate_config()
         )
-
-        if response.candidates and response.candidates[0].content.parts:
-            for part in response.candidates[0].content.parts:
+        async for chunk in stream:
+            if not chunk.candidates or not chunk.candidates[0].content:
+                continue
+            for part in chunk.candidates[0].content.parts or []:
                 if part.inline_data:
-                    return Image.open(io.BytesIO(part.inline_data.data))
+                    save_args = (output_path, part.inline_data.data, part.inline_data.mime_type)
+                    if executor and part.inline_data.mime_type != "image/png":
+                        loop = asyncio.get_running_loop()
+                        await loop.run_in_executor(executor, save_image_data, *save_args)
+                    else:
+                        await asyncio.to_thread(save_image_data, *save_args)
+                    return True
                 elif part.text:
                     print(f"  Model text: {part.text}")
+        return False
+
+    try:
+        if await _with_retry(stream_to_file, f"{image_path.name} -> {language_code}"):
+            return True
 
         print(f"  Warning: No image returned for {image_path.name} -> {language_code}")
-        return None
+        return False
 
     except Exception as e:
         print(f"  Error translating {image_path.name} to {language_code}: {e}")
-        return None
+        return False
 
 
-def translate_screenshots(base_dir: Path = None, languages: dict = None,
-                          force: bool = False, env_path: str = None):
+async def _translate_one(client, semaphore: asyncio.Semaphore, generate_config,
+                         executor: ProcessPoolExecutor, png_file: Path, output_path: Path,
+                         lang_code: str, lang_name: str):
+    """Translate one screenshot into one language and save it."""
+    async with semaphore:
+        print(f"  Translating {png_file.name} -> {lang_code}...")
+        saved = await translate_image(client, png_file, output_path, lang_code, lang_name,
+                                      generate_config, executor)
+
+    if saved:
+        print(f"  Saved: {output_path}")
+    return saved
+
+
+def _gemini_client(api_key: str, transport: httpx.AsyncHTTPTransport):
+    """Create a Gemini client whose async requests all go through transport's connection pool."""
+    return genai.Client(
+        api_key=api_key,
+        http_options=types.HttpOptions(async_client_args={"transport": transport})
+    )
+
+
+async def _run_translations(api_key: str, jobs: list, concurrency: int) -> list:
     """
-    Translate screenshots to multiple languages.
+    Run (png_file, output_path, lang_code, lang_name) jobs concurrently.
 
-    Args:
-        base_dir: Directory containing PNG files (default: current directory)
-        languages: Dict of {code: name} for target languages (default: DEFAULT_LANGUAGES)
-        force: If True, overwrite existing translated files
-        env_path: Path to .env file
+    Returns one bool per job, in order: whether its image was saved.
+
+    All requests share one HTTP connection pool (multiplexed over HTTP/2 when
+    h2 is installed), so TLS handshakes aren't repeated per request.
+    Images that need converting to PNG are encoded in a process pool, whose
+    workers only start if such an image arrives.
+    """
+    # Retries are handled by _with_retry
+    transport = httpx.AsyncHTTPTransport(
+        http2=config.HAS_HTTP2,
+        retries=0,
+        limits=httpx.Limits(max_connections=concurrency, max_keepalive_connections=concurrency)
+    )
+    client = _gemini_client(api_key, transport)
+    semaphore = asyncio.Semaphore(concurrency)
+    executor = ProcessPoolExecutor(max_workers=os.cpu_count())
+    generate_config = _generate_config()
+
+    try:
+        results = await asyncio.gather(
+            *(_translate_one(client, semaphore, generate_config, executor, *job) for job in jobs),
+            return_exceptions=True
+        )
+    finally:
+        executor.shutdown()
+        await transport.aclose()
+
+    for (png_file, _, lang_code, _), result in zip(jobs, results):
+        if isinstance(result, Exception):
+            print(f"  Error translating {png_file.name} to {lang_code}: {result}")
+
+    return [result is True for result in results]
+
+
+# =============================================================================
+# Batch Mode
+# =============================================================================
+
+def _batch_key(output_path: Path) -> str:
+    """Key identifying a job's result in the batch output, e.g. "de/ios_1.png"."""
+    return f"{output_path.parent.name}/{output_path.name}"
+
+
+def build_batch_request(png_file: Path, output_path: Path, lang_name: str) -> dict:
+    """Build one JSONL line of a Gemini batch input file."""
+    image_data, mime_type = encode_source_image(png_file)
+    return {
+        "key": _batch_key(output_path),
+        "request": {
+            "system_instruction": {"parts": [{"text": SYSTEM_INSTRUCTION}]},
+            "contents": [{
+                "parts": [
+                    {"text": build_prompt(lang_name)},
+                    {"inline_data": {
+                        "mime_type": mime_type,
+                        "data": base64.b64encode(image_data).decode("ascii"),
+                    }},
+                ]
+            }],
+            "generation_config": {"temperature": 0.4},
+        },
+    }
+
+
+def _image_from_batch_response(response: dict) -> tuple:
+    """Return (image bytes, mime type) for the first image in a batch response, or (None, None)."""
+    for candidate in response.get("candidates", []):
+        for part in candidate.get("content", {}).get("parts", []):
+            inline_data = part.get("inlineData") or part.get("inline_data")
+            if inline_data:
+                mime_type = inline_data.get("mimeType") or inline_data.get("mime_type")
+                return base64.b64decode(inline_data["data"]), mime_type
+            if part.get("text"):
+                print(f"  Model text: {part['text']}")
+    return None, None
+
+
+def _run_batch(client, jobs: list) -> list:
+    """
+    Translate (png_file, output_path, lang_code, lang_name) jobs with one Gemini batch job.
+
+    Batch requests cost half as much as regular ones and use a separate quota,
+    but can take up to 24 hours. This blocks, polling until the job finishes,
+    then saves every returned image. Returns one bool per job, in order:
+    whether its image was saved.
+    """
+    with tempfile.NamedTemporaryFile("w", suffix=".jsonl", delete=False) as f:
+        for png_file, output_path, _, lang_name in jobs:
+            f.write(json.dumps(build_batch_request(png_file, output_path, lang_name)) + "\n")
+        input_path = f.name
+
+    try:
+        uploaded = client.files.upload(
+            file=input_path,
+            config=types.UploadFileConfig(mime_type="jsonl", display_name="screenshot-translations")
+        )
+    finally:
+        os.unlink(input_path)
+
+    job = client.batches.create(model=config.GEMINI_MODEL, src=uploaded.name)
+    print(f"Submitted batch {job.name} ({len(jobs)} requests)")
+
+    failures = 0
+    while job.state.name not in BATCH_DONE_STATES:
+        print(f"  {job.state.name}, checking again in {BATCH_POLL_INTERVAL}s...")
+        time.sleep(BATCH_POLL_INTERVAL)
+        try:
+            job = client.batches.get(name=job.name)
+            failures = 0
+        except Exception as e:
+            failures += 1
+            transient = _is_retryable(e) or isinstance(e, httpx.TransportError)
+            if transient and failures <= BATCH_POLL_RETRIES:
+                print(f"  Status check failed ({e}), retrying ({failures}/{BATCH_POLL_RETRIES})...")
+                continue
+            print(f"Error: Gave up waiting for batch {job.name}: {e}")
+            print(f"  The job keeps running; fetch its results later from Google AI Studio "
+                  f"or with client.batches.get(name=\"{job.name}\")")
+            return [False] * len(jobs)
+
+    print(f"Batch finished: {job.state.name}")
+    if not job.dest or not job.dest.file_name:
+        if job.error:
+            print(f"  Error: {job.error}")
+        return [False] * len(jobs)
+
+    output_paths = {_batch_key(output_path): output_path for _, output_path, _, _ in jobs}
+    saved = set()
+    results = client.files.download(file=job.dest.file_name)
+
+    for line in results.decode("utf-8").splitlines():
+        if not line.strip():
+            continue
+        result = json.loads(line)
+        key = result.get("key")
+        output_path = output_paths.get(key)
+        if output_path is None:
+            continue
+
+        if "error" in result:
+            print(f"  Error translating {key}: {result['error']}")
+            continue
+
+        image_data, mime_type = _image_from_batch_response(result.get("response", {}))
+        if image_data:
+            save_image_data(output_path, image_data, mime_type)
+            saved.add(output_path)
+            print(f"  Saved: {output_path}")
+        else:
+            print(f"  Warning: No image returned for {key}")
+
+    return [output_path in saved for _, output_path, _, _ in jobs]
+
+
+# =============================================================================
+# Translation Cache
+# =============================================================================
+
+def open_screenshot_cache(base_dir: Path) -> sqlite3.Connection:
+    """Open (creating if needed) the screenshot translation cache in base_dir."""
+    conn = sqlite3.connect(base_dir / SCREENSHOT_CACHE_FILE)
+    conn.execute(
+        """CREATE TABLE IF NOT EXISTS translated_screenshots (
+            key TEXT PRIMARY KEY,
+            image BLOB
+        )"""
+    )
+    return conn
+
+
+def screenshot_cache_key(image_digest: bytes, lang_code: str, lang_name: str) -> str:
+    """
+    Cache key for translating an image (given its SHA-256 digest) to a language.
+
+    Covers everything that shapes the request: the source image, target
+    language, prompt and model.
+    """
+    key = hashlib.sha256(image_digest)
+    for part in (lang_code, build_prompt(lang_name), SYSTEM_INSTRUCTION, config.GEMINI_MODEL):
+        key.update(part.encode("utf-8") + b"\0")
+    return key.hexdigest()
+
+
+def get_cached_screenshot(conn: sqlite3.Connection, key: str) -> bytes:
+    """Return the PNG data of an earlier translation by cache key, or None if there isn't one."""
+    row = conn.execute("SELECT image FROM translated_screenshots WHERE key = ?", (key,)).fetchone()
+    return row[0] if row else None
+
+
+def store_cached_screenshot(conn: sqlite3.Connection, key: str, output_path: Path):
+    """
+    Store the translation just written to output_path under key.
+
+    The image itself is kept, so it can be restored even after the translated
+    file has been deleted.
+    """
+    conn.execute(
+        "INSERT OR REPLACE INTO translated_screenshots VALUES (?, ?)",
+        (key, output_path.read_bytes())
+    )
+
+
+def _require_env(env_path: str = None) -> str:
+    """
+    Check that google-genai is installed and load the Gemini API key.
+
+    Prints what's missing and returns None if either check fails.
     """
     if genai is None:
         print("Error: google-genai package not installed")
         print("Install with: pip install google-genai")
-        return
+        return None
 
     # Load configuration
     if env_path:
@@ -110,16 +535,45 @@ def translate_screenshots(base_dir: Path = None, languages: dict = None,
     else:
         config.load_config()
 
-    api_key = config.GOOGLE_API_KEY
+    api_key = config.GOOGLE_API_KEY or os.environ.get("GOOGLE_API_KEY")
     if not api_key:
         print("Error: GOOGLE_API_KEY not found in environment")
         print("Set GOOGLE_API_KEY in your .env file")
+        return None
+
+    return api_key
+
+
+def translate_screenshots(base_dir: Path = None, languages: dict = None,
+                          force: bool = False, env_path: str = None,
+                          concurrency: int = None, batch: bool = False,
+                          use_cache: bool = True):
+    """
+    Translate screenshots to multiple languages.
+
+    Args:
+        base_dir: Directory containing PNG files (default: current directory)
+        languages: Dict of {code: name} for target languages (default: DEFAULT_LANGUAGES)
+        force: If True, overwrite existing translated files
+        env_path: Path to .env file
+        concurrency: Maximum Gemini requests in flight (default: GEMINI_CONCURRENCY)
+        batch: If True, submit everything as one Gemini batch job (half price,
+            results within 24 hours) and wait for it
+        use_cache: If True (default), reuse earlier translations of unchanged
+            screenshots from SCREENSHOT_CACHE_FILE instead of calling Gemini.
+            With force, new translations are still recorded but never reused
+    """
+    if concurrency is not None and concurrency < 1:
+        print("Error: concurrency must be at least 1")
+        return
+
+    api_key = _require_env(env_path)
+    if not api_key:
         return
 
     base_dir = base_dir or Path.cwd()
     languages = languages or DEFAULT_LANGUAGES
-
-    client = genai.Client(api_key=api_key)
+    concurrency = concurrency or config.gemini_concurrency()
 
     png_files = get_png_files(base_dir)
 
@@ -131,26 +585,50 @@ def translate_screenshots(base_dir: Path = None, languages: dict = None,
     print(f"Target languages: {', '.join(languages.values())}")
     print()
 
+    cache = open_screenshot_cache(base_dir) if use_cache else None
+    digests = {}
+
+    jobs = []
+    cache_keys = []
     for lang_code, lang_name in languages.items():
         lang_dir = base_dir / lang_code
         lang_dir.mkdir(exist_ok=True)
 
-        print(f"Processing {lang_name} ({lang_code})...")
-
         for png_file in png_files:
             output_path = lang_dir / png_file.name
 
             if output_path.exists() and not force:
-                print(f"  Skipping {png_file.name} (already exists)")
+                print(f"  Skipping {lang_code}/{png_file.name} (already exists)")
                 continue
 
-            print(f"  Translating {png_file.name}...")
-
-            output_image = translate_image(client, png_file, lang_code, lang_name)
-
-            if output_image:
-                output_image.save(output_path)
-                print(f"  Saved: {output_path}")
+            key = None
+            if cache:
+                if png_file not in digests:
+                    digests[png_file] = hashlib.sha256(png_file.read_bytes()).digest()
+                key = screenshot_cache_key(digests[png_file], lang_code, lang_name)
+                cached_image = None if force else get_cached_screenshot(cache, key)
+                if cached_image:
+                    save_image_data(output_path, cached_image)
+                    print(f"  Reused cached translation for {lang_code}/{png_file.name}")
+                    continue
+
+            jobs.append((png_file, output_path, lang_code, lang_name))
+            cache_keys.append(key)
+
+    saved = []
+    if jobs and batch:
+        saved = _run_batch(genai.Client(api_key=api_key), jobs)
+    elif jobs:
+        print(f"Translating {len(jobs)} screenshots ({concurrency} at a time)...")
+        saved = asyncio.run(_run_translations(api_key, jobs, concurrency))
+    _encode_source_image.cache_clear()
+
+    if cache:
+        for (_, output_path, _, _), key, was_saved in zip(jobs, cache_keys, saved):
+            if was_saved:
+                store_cached_screenshot(cache, key, output_path)
+        cache.commit()
+        cache.close()
 
     print()
     print("Done!")
@@ -166,8 +644,21 @@ def main():
                         help="Specific language codes to translate to (e.g., de ja ko)")
     parser.add_argument("--env", type=str,
                         help="Path to .env file")
+    parser.add_argument("--concurrency", type=int,
+                        help="Maximum Gemini requests in flight (default: GEMINI_CONCURRENCY or 8)")
+    parser.add_argument("--batch", action="store_true",
+                        help="Use the Gemini Batch API (50%% cheaper, results within 24 hours)")
+    parser.add_argument("--no-cache", action="store_true",
+                        help="Don't reuse or record cached translations of unchanged screenshots")
     args = parser.parse_args()
 
+    if args.concurrency is not None and args.concurrency < 1:
+        parser.error("--concurrency must be at least 1")
+
+    # Fail before doing any work if the package or API key is missing
+    if not _require_env(args.env):
+        sys.exit(1)
+
     languages = DEFAULT_LANGUAGES
     if args.languages:
         languages = {code: DEFAULT_LANGUAGES.get(code, code) for code in args.languages
@@ -176,7 +667,9 @@ def main():
             print(f"No valid languages specified. Available: {', '.join(DEFAULT_LANGUAGES.keys())}")
             return
 
-    translate_screenshots(languages=languages, force=args.force, env_path=args.env)
+    translate_screenshots(languages=languages, force=args.force, env_path=args.env,
+                          concurrency=args.concurrency, batch=args.batch,
+                          use_cache=not args.no_cache)
 
 
 if __name__ == "__main__":